@@ -10,12 +10,13 @@ RSS_FEEDS = {
     "New York Times": "https://rss.nytimes.com/services/xml/rss/nyt/World.xml",
 }
 
-# Keywords to identify China-related articles (all lowercase for case-insensitive matching)
-CHINA_KEYWORDS = [
+# Keywords to identify China-related articles (all lowercase for case-insensitive matching);
+# a tuple so the shared configuration cannot be mutated at runtime
+CHINA_KEYWORDS = (
     "china", "chinese", "beijing", "xi jinping", "xi", "ccp",
     "taiwan", "taiwanese", "hong kong", "xinjiang", "tibet", 
     "shanghai", "guangzhou", "shenzhen", "prc", "people's republic"
-]
+)
 
 # Sentiment thresholds for classification
 SENTIMENT_THRESHOLDS = {
@@ -31,5 +32,8 @@ SENTIMENT_NORMALIZATION_FACTOR = 0.1
 # Number of months to look back
 MONTHS_TO_ANALYZE = 12
 
+# Directory for cached feed data reused between runs
+CACHE_DIR = ".cache"
+
 # Output directory for generated site
 OUTPUT_DIR = "site"
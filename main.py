@@ -2,7 +2,7 @@
 """Main script to generate the China news sentiment analysis site."""
 
 import logging
-from config import RSS_FEEDS, CHINA_KEYWORDS, OUTPUT_DIR, MONTHS_TO_ANALYZE
+from config import RSS_FEEDS, CHINA_KEYWORDS, OUTPUT_DIR, MONTHS_TO_ANALYZE, CACHE_DIR
 from rss_fetcher import RSSFetcher
 from sentiment_analyzer import SentimentAnalyzer
 from site_generator import SiteGenerator
@@ -22,11 +22,11 @@ def main():
     logger.info("=" * 60)
     logger.info("Step 1: Fetching RSS feeds")
     logger.info("=" * 60)
-    fetcher = RSSFetcher(months_back=MONTHS_TO_ANALYZE)
+    fetcher = RSSFetcher(months_back=MONTHS_TO_ANALYZE, cache_dir=CACHE_DIR)
     all_articles = fetcher.fetch_all_feeds(RSS_FEEDS)
     
     total_articles = sum(len(articles) for articles in all_articles.values())
-    logger.info(f"Total articles fetched: {total_articles}")
+    logger.info("Total articles fetched: %d", total_articles)
     
     # Step 2: Filter China-related articles and analyze sentiment
     logger.info("=" * 60)
@@ -36,17 +36,11 @@ def main():
     
     china_articles = {}
     for source, articles in all_articles.items():
-        # Filter for China-related content
-        filtered = analyzer.filter_china_articles(articles)
-        # Analyze sentiment
-        if filtered:
-            analyzed = analyzer.analyze_articles(filtered)
-            china_articles[source] = analyzed
-        else:
-            china_articles[source] = []
+        # Filter for China-related content and analyze sentiment in one pass
+        china_articles[source] = analyzer.process(articles)
     
     total_china_articles = sum(len(articles) for articles in china_articles.values())
-    logger.info(f"Total China-related articles: {total_china_articles}")
+    logger.info("Total China-related articles: %d", total_china_articles)
     
     # Step 3: Generate static site
     logger.info("=" * 60)
@@ -58,7 +52,7 @@ def main():
     
     logger.info("=" * 60)
     logger.info("✅ Site generation complete!")
-    logger.info(f"📁 Output directory: {OUTPUT_DIR}")
+    logger.info("📁 Output directory: %s", OUTPUT_DIR)
     logger.info("=" * 60)
 
 
@@ -1,6 +1,13 @@
 """Module for fetching and parsing RSS feeds."""
 
 import feedparser
+import hashlib
+import json
+import os
+import pickle
+import requests
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from dateutil import parser as date_parser
 from dateutil.relativedelta import relativedelta
@@ -10,10 +17,26 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Accept header feedparser sends when it downloads feeds itself
+FEED_ACCEPT_HEADER = (
+    "application/atom+xml,application/rdf+xml,application/rss+xml,"
+    "application/x-netcdf,application/xml;q=0.9,text/xml;q=0.2,*/*;q=0.1"
+)
+
+# Version of the pickled article cache; bump whenever Article's attributes change
+# so caches written by older code are ignored instead of unpickled
+FEED_CACHE_VERSION = 1
+
 
 class Article:
     """Represents a news article from an RSS feed."""
     
+    # Fixed attribute set: no per-instance __dict__ and faster attribute access
+    __slots__ = (
+        "title", "link", "published", "published_ts", "description", "source",
+        "full_text", "full_text_lower", "sentiment_score", "sentiment_label",
+    )
+    
     def __init__(self, title: str, link: str, published: datetime, 
                  description: str, source: str):
         self.title = title
@@ -23,8 +46,13 @@ class Article:
             self.published = published.replace(tzinfo=timezone.utc)
         else:
             self.published = published.astimezone(timezone.utc)
+        # Epoch seconds for cheap recency comparisons
+        self.published_ts = self.published.timestamp()
         self.description = description
         self.source = source
+        # Combined text used for keyword matching and sentiment, computed once
+        self.full_text = f"{title} {description}"
+        self.full_text_lower = self.full_text.lower()
         self.sentiment_score = None
         self.sentiment_label = None
     
@@ -44,31 +72,165 @@ class Article:
 class RSSFetcher:
     """Fetches and parses RSS feeds."""
     
-    def __init__(self, months_back: int = 12):
+    def __init__(self, months_back: int = 12, timeout: float = 10,
+                 cache_dir: Optional[str] = None):
         self.months_back = months_back
+        self.timeout = timeout
         # Use relativedelta for accurate month calculation
         self.cutoff_date = datetime.now(timezone.utc) - relativedelta(months=months_back)
+        self.cutoff_ts = self.cutoff_date.timestamp()
+        # A shared session reuses connections (and TLS handshakes) across feeds
+        self._session = requests.Session()
+        # Identify as feedparser did; some CDNs reject the default python-requests agent
+        self._session.headers["User-Agent"] = feedparser.USER_AGENT
+        self._session.headers["Accept"] = FEED_ACCEPT_HEADER
+        # With a cache directory, ETag/Last-Modified validators and parsed articles
+        # are persisted so unchanged feeds are revalidated and never re-parsed
+        self.cache_dir = cache_dir
+        self._validators = self._load_validators()
     
     def fetch_feed(self, feed_url: str, source_name: str) -> List[Article]:
         """Fetch and parse a single RSS feed."""
-        logger.info(f"Fetching feed from {source_name}...")
-        
         try:
-            feed = feedparser.parse(feed_url)
-            articles = []
+            # Download with a bounded timeout; feedparser.parse(url) can hang indefinitely
+            response = self._session.get(
+                feed_url, headers=self._conditional_headers(feed_url), timeout=self.timeout
+            )
+            not_modified = response.status_code == 304
+            if not_modified:
+                parsed = self._load_from_cache(feed_url)
+                if parsed is None:
+                    # The cached articles are unusable, so fetch the feed in full
+                    response = self._session.get(feed_url, timeout=self.timeout)
+                    not_modified = False
+            if not not_modified:
+                response.raise_for_status()
+                # Pass the response headers on so feedparser can use the declared
+                # charset; it expects lowercase header names. Content-Location tells
+                # it the feed's URL, against which relative item links are resolved.
+                response_headers = {k.lower(): v for k, v in response.headers.items()}
+                response_headers.setdefault("content-location", response.url)
+                feed = feedparser.parse(response.content, response_headers=response_headers)
+                parsed = [
+                    article for article in
+                    (self._parse_entry(entry, source_name) for entry in feed.entries)
+                    if article is not None
+                ]
+                self._store_in_cache(feed_url, response, parsed)
             
-            for entry in feed.entries:
-                article = self._parse_entry(entry, source_name)
-                if article and self._is_recent(article):
-                    articles.append(article)
+            # Bind the predicate locally so the comprehension avoids repeated lookups;
+            # cached articles are re-checked since the window moves between runs
+            is_recent = self._is_recent
+            articles = [a for a in parsed if is_recent(a)]
             
-            logger.info(f"Found {len(articles)} recent articles from {source_name}")
+            logger.info(
+                "Found %d recent articles from %s%s", len(articles), source_name,
+                " (not modified, cached)" if not_modified else ""
+            )
             return articles
             
         except Exception as e:
-            logger.error(f"Error fetching feed from {source_name}: {e}")
+            logger.error("Error fetching feed from %s: %s", source_name, e)
             return []
     
+    def _cache_path(self, feed_url: str) -> str:
+        """Return the path of the cached parsed articles for a feed URL."""
+        digest = hashlib.sha1(feed_url.encode("utf-8")).hexdigest()
+        return os.path.join(
+            self.cache_dir, f"feeds-v{FEED_CACHE_VERSION}", f"{digest}.pickle"
+        )
+    
+    def _validators_path(self) -> str:
+        """Return the path of the JSON file holding ETag/Last-Modified validators."""
+        return os.path.join(self.cache_dir, "feeds.json")
+    
+    def _load_validators(self) -> Dict[str, Dict[str, str]]:
+        """Load persisted validators, keyed by feed URL."""
+        if not self.cache_dir or not os.path.exists(self._validators_path()):
+            return {}
+        try:
+            with open(self._validators_path(), "r", encoding="utf-8") as f:
+                validators = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable feed cache: %s", e)
+            return {}
+        # Anything but a mapping of URL to validator dict would break every fetch
+        if not isinstance(validators, dict) or not all(
+            isinstance(v, dict) for v in validators.values()
+        ):
+            logger.warning("Ignoring malformed feed cache: %s", self._validators_path())
+            return {}
+        return validators
+    
+    def _save_validators(self):
+        """Persist validators so the next run can send conditional requests."""
+        if not self.cache_dir:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        data = json.dumps(self._validators, indent=2).encode("utf-8")
+        self._write_atomically(self._validators_path(), data)
+    
+    def _conditional_headers(self, feed_url: str) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers for a cached feed."""
+        validators = self._validators.get(feed_url)
+        # Only revalidate when the cached articles are still there to fall back on
+        if not validators or not os.path.exists(self._cache_path(feed_url)):
+            return {}
+        
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+    
+    def _store_in_cache(self, feed_url: str, response: requests.Response,
+                        articles: List[Article]):
+        """Cache a feed's parsed articles along with its validators."""
+        if not self.cache_dir:
+            return
+        etag = response.headers.get("ETag", "")
+        last_modified = response.headers.get("Last-Modified", "")
+        if not etag and not last_modified:
+            return
+        
+        path = self._cache_path(feed_url)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._write_atomically(path, pickle.dumps(articles))
+        except OSError as e:
+            # The freshly parsed articles are still good; only caching is skipped
+            logger.warning("Could not cache feed %s: %s", feed_url, e)
+            return
+        self._validators[feed_url] = {"etag": etag, "last_modified": last_modified}
+    
+    def _load_from_cache(self, feed_url: str) -> Optional[List[Article]]:
+        """Load a feed's cached articles, discarding the entry if it is unreadable."""
+        try:
+            with open(self._cache_path(feed_url), "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning("Discarding unreadable feed cache for %s: %s", feed_url, e)
+            # Drop the validators too, or every later run would get 304 again
+            self._validators.pop(feed_url, None)
+            try:
+                os.remove(self._cache_path(feed_url))
+            except OSError:
+                pass
+            return None
+    
+    @staticmethod
+    def _write_atomically(path: str, data: bytes):
+        """Write data to path via a temporary file so readers never see a partial file."""
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    
     def _parse_entry(self, entry, source_name: str) -> Optional[Article]:
         """Parse a single feed entry into an Article object."""
         try:
@@ -76,9 +238,13 @@ class RSSFetcher:
             link = entry.get("link", "")
             description = entry.get("description", "") or entry.get("summary", "")
             
-            # Parse publication date
+            # Prefer feedparser's pre-parsed UTC struct_time over re-parsing the string
+            pub_date_parsed = entry.get("published_parsed") or entry.get("updated_parsed")
             pub_date_str = entry.get("published") or entry.get("updated")
-            if pub_date_str:
+            if pub_date_parsed:
+                pub_date = datetime(*pub_date_parsed[:6], tzinfo=timezone.utc)
+            elif pub_date_str:
+                # Fall back to dateutil for formats feedparser could not parse
                 pub_date = date_parser.parse(pub_date_str)
                 # Ensure timezone-aware UTC
                 if pub_date.tzinfo is None:
@@ -91,19 +257,35 @@ class RSSFetcher:
             return Article(title, link, pub_date, description, source_name)
             
         except Exception as e:
-            logger.warning(f"Error parsing entry: {e}")
+            logger.warning("Error parsing entry: %s", e)
             return None
     
     def _is_recent(self, article: Article) -> bool:
         """Check if article is within the time window."""
-        return article.published >= self.cutoff_date
+        return article.published_ts >= self.cutoff_ts
     
     def fetch_all_feeds(self, feeds: Dict[str, str]) -> Dict[str, List[Article]]:
-        """Fetch all RSS feeds and return articles grouped by source."""
-        all_articles = {}
+        """Fetch all RSS feeds concurrently and return articles grouped by source."""
+        # Pre-populate in configured order so output is stable regardless of completion order
+        all_articles = {source_name: [] for source_name in feeds}
+        if not feeds:
+            return all_articles
         
-        for source_name, feed_url in feeds.items():
-            articles = self.fetch_feed(feed_url, source_name)
-            all_articles[source_name] = articles
+        with ThreadPoolExecutor(max_workers=min(8, len(feeds))) as executor:
+            futures = {
+                executor.submit(self.fetch_feed, feed_url, source_name): source_name
+                for source_name, feed_url in feeds.items()
+            }
+            for future in as_completed(futures):
+                source_name = futures[future]
+                try:
+                    all_articles[source_name] = future.result()
+                except Exception as e:
+                    logger.error("Error fetching feed from %s: %s", source_name, e)
         
+        try:
+            self._save_validators()
+        except OSError as e:
+            # Caching is best-effort; the fetched articles are still good
+            logger.warning("Could not save feed cache: %s", e)
         return all_articles
@@ -1,8 +1,8 @@
-"""Module for sentiment analysis using spaCy."""
+"""Module for lexicon-based sentiment analysis using spaCy's stop-word list."""
 
 import re
-import spacy
-from typing import List
+from spacy.lang.en.stop_words import STOP_WORDS
+from typing import List, Sequence
 import logging
 from rss_fetcher import Article
 from config import SENTIMENT_THRESHOLDS, SENTIMENT_NORMALIZATION_FACTOR
@@ -10,83 +10,99 @@ from config import SENTIMENT_THRESHOLDS, SENTIMENT_NORMALIZATION_FACTOR
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Word tokens approximating spaCy's English tokenizer, so STOP_WORDS filtering and
+# the word count match the Doc-based scorer: clitics ("'s", "'re", "n't", ...) are
+# split off as their own (stop word) tokens, numbers with internal separators
+# ("4.6", "1,250,000", "10:30", "9/11") and dotted abbreviations ("u.s.",
+# "u.k.-based") stay whole, hyphens split words ("5-year") except before digits
+# ("covid-19"), "o'brien" stays whole, and letters/digits are Unicode-aware
+# ("café", "2024"). Known differences from spaCy: currency symbols ("$") are not
+# counted and numbers with units stay joined ("5km" is one word, two for spaCy).
+WORD_PATTERN = re.compile(
+    r"\d+(?:[.,:/]\d+)+[^\W_]*"
+    r"|(?:[^\W\d_]\.){2,}(?:-[^\W_]+)*"
+    r"|[^\W_]*[^\W\d_](?:-\d[^\W_]*)+"
+    r"|'(?:s|re|ve|ll|d|m)\b"
+    r"|n't\b"
+    r"|[^\W_]+?(?=n't\b)"
+    r"|[^\W_]+(?:'(?!(?:s|re|ve|ll|d|m)\b)[^\W_]+)*"
+)
+
+# Word polarity lexicons, built once at import rather than on every call
+POSITIVE_WORDS = frozenset({
+    "good", "great", "excellent", "positive", "fortunate", "correct",
+    "superior", "success", "successful", "growth", "gain", "prosper",
+    "prosperity", "benefit", "improve", "improvement", "advance",
+    "advancement", "progress", "boom", "win", "winning", "leader",
+    "leading", "strong", "strength", "breakthrough", "innovation"
+})
+
+NEGATIVE_WORDS = frozenset({
+    "bad", "terrible", "awful", "negative", "unfortunate", "wrong",
+    "inferior", "failure", "fail", "decline", "loss", "lose",
+    "crisis", "problem", "issue", "concern", "threat", "threaten",
+    "risk", "danger", "dangerous", "conflict", "tension", "dispute",
+    "criticism", "criticize", "condemn", "sanction", "weak", "weakness"
+})
+
 
 class SentimentAnalyzer:
-    """Analyzes sentiment of articles using spaCy."""
+    """Scores article sentiment from word polarity lexicons, ignoring spaCy stop words."""
     
-    def __init__(self, keywords: List[str]):
+    def __init__(self, keywords: Sequence[str]):
         self.keywords = [kw.lower() for kw in keywords]
-        # Compile regex patterns with word boundaries for whole-word matching
-        self.keyword_patterns = [
-            re.compile(rf'\b{re.escape(kw)}\b', re.IGNORECASE)
-            for kw in self.keywords
-        ]
-        logger.info("Loading spaCy model...")
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            logger.error("spaCy model not found. Installing...")
-            import subprocess
-            subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"])
-            self.nlp = spacy.load("en_core_web_sm")
-        
-        # Add sentiment analyzer to pipeline if not present
-        if "sentencizer" not in self.nlp.pipe_names:
-            self.nlp.add_pipe("sentencizer")
+        # Compile a single alternation with word boundaries so each text is
+        # scanned once for all keywords, still matching whole words only.
+        # Keywords are lowercase and matched against lowercased text, which is
+        # much faster than re.IGNORECASE.
+        alternation = "|".join(
+            re.escape(kw) for kw in sorted(self.keywords, key=len, reverse=True)
+        )
+        self.keyword_pattern = re.compile(rf'\b(?:{alternation})\b')
     
     def contains_china_reference(self, text: str) -> bool:
         """Check if text contains any China-related keywords as whole words."""
-        return any(pattern.search(text) for pattern in self.keyword_patterns)
+        return self._matches_keywords(text.lower())
+    
+    def _matches_keywords(self, text_lower: str) -> bool:
+        """Check already-lowercased text for China-related keywords."""
+        return self.keyword_pattern.search(text_lower) is not None
     
     def filter_china_articles(self, articles: List[Article]) -> List[Article]:
         """Filter articles that mention China or related keywords."""
         filtered = []
         
         for article in articles:
-            full_text = f"{article.title} {article.description}"
-            if self.contains_china_reference(full_text):
+            if self._matches_keywords(article.full_text_lower):
                 filtered.append(article)
         
-        logger.info(f"Filtered {len(filtered)} China-related articles from {len(articles)} total")
+        logger.info("Filtered %d China-related articles from %d total", len(filtered), len(articles))
         return filtered
     
     def analyze_sentiment(self, text: str) -> float:
         """
-        Analyze sentiment of text using spaCy.
+        Analyze sentiment of text using word polarity counts.
         Returns a score between -1 (negative) and 1 (positive).
         """
-        doc = self.nlp(text)
-        
+        return self._score_lowered(text.lower())
+    
+    def _score_lowered(self, text_lower: str) -> float:
+        """Score already-lowercased text between -1 and 1."""
         # Simple sentiment analysis based on word polarity
         # This is a basic implementation; for production, consider using
         # a dedicated sentiment analysis model or library
-        positive_words = {
-            "good", "great", "excellent", "positive", "fortunate", "correct",
-            "superior", "success", "successful", "growth", "gain", "prosper",
-            "prosperity", "benefit", "improve", "improvement", "advance",
-            "advancement", "progress", "boom", "win", "winning", "leader",
-            "leading", "strong", "strength", "breakthrough", "innovation"
-        }
-        
-        negative_words = {
-            "bad", "terrible", "awful", "negative", "unfortunate", "wrong",
-            "inferior", "failure", "fail", "decline", "loss", "lose",
-            "crisis", "problem", "issue", "concern", "threat", "threaten",
-            "risk", "danger", "dangerous", "conflict", "tension", "dispute",
-            "criticism", "criticize", "condemn", "sanction", "weak", "weakness"
-        }
-        
-        total_words = 0
+        # A regex scan is all the scorer needs; a full spaCy Doc is far more expensive
+        # Feeds commonly use the typographic apostrophe ("china’s", "won’t")
+        text_lower = text_lower.replace("\u2019", "'")
+        words = [w for w in WORD_PATTERN.findall(text_lower) if w not in STOP_WORDS]
+        total_words = len(words)
         sentiment_score = 0
         
-        for token in doc:
-            if not token.is_stop and not token.is_punct:
-                total_words += 1
-                word_lower = token.text.lower()
-                if word_lower in positive_words:
-                    sentiment_score += 1
-                elif word_lower in negative_words:
-                    sentiment_score -= 1
+        for word in words:
+            if word in POSITIVE_WORDS:
+                sentiment_score += 1
+            elif word in NEGATIVE_WORDS:
+                sentiment_score -= 1
         
         # Normalize score to -1 to 1 range
         if total_words > 0:
@@ -115,9 +131,26 @@ class SentimentAnalyzer:
     def analyze_articles(self, articles: List[Article]) -> List[Article]:
         """Analyze sentiment for all articles."""
         for article in articles:
-            full_text = f"{article.title} {article.description}"
-            score = self.analyze_sentiment(full_text)
-            article.sentiment_score = round(score, 3)
-            article.sentiment_label = self.get_sentiment_label(score)
+            score = self._score_lowered(article.full_text_lower)
+            self._set_sentiment(article, score)
         
         return articles
+    
+    def process(self, articles: List[Article]) -> List[Article]:
+        """Filter China-related articles and analyze their sentiment in a single pass."""
+        processed = []
+        
+        for article in articles:
+            # The lowercased text is computed once on the article and shared by both steps
+            text_lower = article.full_text_lower
+            if self._matches_keywords(text_lower):
+                self._set_sentiment(article, self._score_lowered(text_lower))
+                processed.append(article)
+        
+        logger.info("Filtered %d China-related articles from %d total", len(processed), len(articles))
+        return processed
+    
+    def _set_sentiment(self, article: Article, score: float):
+        """Store a sentiment score and its label on an article."""
+        article.sentiment_score = round(score, 3)
+        article.sentiment_label = self.get_sentiment_label(score)
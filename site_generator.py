@@ -1,8 +1,13 @@
 """Module for generating static HTML pages."""
 
+import math
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
 from typing import Dict, List
-from jinja2 import Template
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache, Template
+from config import CACHE_DIR
 from rss_fetcher import Article
 from datetime import datetime, timezone
 import json
@@ -11,107 +16,172 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+STYLESHEET = """body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
+    line-height: 1.6;
+    max-width: 1200px;
+    margin: 0 auto;
+    padding: 20px;
+    background-color: #f5f5f5;
+}
+h1 {
+    color: #333;
+    border-bottom: 3px solid #007bff;
+    padding-bottom: 10px;
+}
+.summary {
+    background: white;
+    padding: 20px;
+    border-radius: 8px;
+    margin: 20px 0;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+.source-card {
+    background: white;
+    padding: 20px;
+    margin: 15px 0;
+    border-radius: 8px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    transition: box-shadow 0.3s;
+}
+.source-card:hover {
+    box-shadow: 0 4px 8px rgba(0,0,0,0.2);
+}
+.source-card h2 {
+    margin-top: 0;
+    color: #007bff;
+}
+.source-card a {
+    text-decoration: none;
+    color: inherit;
+}
+.sentiment-bar {
+    height: 30px;
+    background: linear-gradient(to right, #dc3545 0%, #ffc107 50%, #28a745 100%);
+    border-radius: 4px;
+    position: relative;
+    margin: 10px 0;
+}
+.sentiment-marker {
+    position: absolute;
+    width: 3px;
+    height: 100%;
+    background: black;
+    top: 0;
+}
+.stats {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
+    gap: 10px;
+    margin: 10px 0;
+}
+.stat {
+    padding: 10px;
+    background: #f8f9fa;
+    border-radius: 4px;
+}
+.stat-label {
+    font-size: 0.85em;
+    color: #666;
+}
+.stat-value {
+    font-size: 1.5em;
+    font-weight: bold;
+    color: #333;
+}
+.sentiment-labels {
+    display: flex;
+    gap: 10px;
+    flex-wrap: wrap;
+    margin: 10px 0;
+}
+.label-badge {
+    padding: 5px 10px;
+    border-radius: 4px;
+    font-size: 0.85em;
+    background: #e9ecef;
+}
+.label-badge.very_positive { background: #28a745; color: white; }
+.label-badge.positive { background: #90ee90; color: black; }
+.label-badge.neutral { background: #ffc107; color: black; }
+.label-badge.negative { background: #ff9999; color: black; }
+.label-badge.very_negative { background: #dc3545; color: white; }
+.back-link {
+    display: inline-block;
+    margin-bottom: 20px;
+    color: #007bff;
+    text-decoration: none;
+}
+.back-link:hover {
+    text-decoration: underline;
+}
+.article-card {
+    background: white;
+    padding: 20px;
+    margin: 15px 0;
+    border-radius: 8px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    border-left: 5px solid #ddd;
+}
+.article-card.very_positive { border-left-color: #28a745; }
+.article-card.positive { border-left-color: #90ee90; }
+.article-card.neutral { border-left-color: #ffc107; }
+.article-card.negative { border-left-color: #ff9999; }
+.article-card.very_negative { border-left-color: #dc3545; }
 
-class SiteGenerator:
-    """Generates static HTML pages for the analysis results."""
-    
-    def __init__(self, output_dir: str = "site"):
-        self.output_dir = output_dir
-        os.makedirs(output_dir, exist_ok=True)
-    
-    def generate_index_page(self, articles_by_source: Dict[str, List[Article]]):
-        """Generate the main index page showing sentiment overview for all outlets."""
-        logger.info("Generating index page...")
-        
-        # Calculate statistics for each source
-        source_stats = []
-        for source, articles in articles_by_source.items():
-            if not articles:
-                continue
-            
-            scores = [a.sentiment_score for a in articles if a.sentiment_score is not None]
-            if not scores:
-                continue
-            
-            avg_score = sum(scores) / len(scores)
-            min_score = min(scores)
-            max_score = max(scores)
-            
-            # Count by sentiment label
-            label_counts = {}
-            for article in articles:
-                label = article.sentiment_label
-                label_counts[label] = label_counts.get(label, 0) + 1
-            
-            source_stats.append({
-                "name": source,
-                "count": len(articles),
-                "avg_score": round(avg_score, 3),
-                "min_score": round(min_score, 3),
-                "max_score": round(max_score, 3),
-                "label_counts": label_counts,
-                "filename": self._get_source_filename(source)
-            })
-        
-        # Sort by average score
-        source_stats.sort(key=lambda x: x["avg_score"], reverse=True)
-        
-        # Generate HTML
-        html = self._get_index_template().render(
-            sources=source_stats,
-            total_articles=sum(s["count"] for s in source_stats),
-            generation_date=datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
-        )
-        
-        output_path = os.path.join(self.output_dir, "index.html")
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html)
-        
-        logger.info(f"Index page generated: {output_path}")
-    
-    def generate_source_pages(self, articles_by_source: Dict[str, List[Article]]):
-        """Generate detail pages for each news outlet."""
-        logger.info("Generating source detail pages...")
-        
-        for source, articles in articles_by_source.items():
-            if not articles:
-                continue
-            
-            # Sort articles by sentiment score
-            sorted_articles = sorted(
-                articles, 
-                key=lambda x: x.sentiment_score if x.sentiment_score is not None else 0,
-                reverse=True
-            )
-            
-            # Convert to dictionaries
-            articles_data = [a.to_dict() for a in sorted_articles]
-            
-            # Calculate statistics
-            scores = [a.sentiment_score for a in articles if a.sentiment_score is not None]
-            avg_score = sum(scores) / len(scores) if scores else 0
-            
-            html = self._get_source_template().render(
-                source=source,
-                articles=articles_data,
-                avg_score=round(avg_score, 3),
-                count=len(articles)
-            )
-            
-            filename = self._get_source_filename(source)
-            output_path = os.path.join(self.output_dir, filename)
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(html)
-            
-            logger.info(f"Generated page for {source}: {output_path}")
-    
-    def _get_source_filename(self, source: str) -> str:
-        """Convert source name to a filename."""
-        return source.lower().replace(" ", "_") + ".html"
-    
-    def _get_index_template(self) -> Template:
-        """Return the Jinja2 template for the index page."""
-        template_str = """<!DOCTYPE html>
+.article-title {
+    font-size: 1.3em;
+    font-weight: bold;
+    margin-bottom: 10px;
+}
+.article-title a {
+    color: #333;
+    text-decoration: none;
+}
+.article-title a:hover {
+    color: #007bff;
+}
+.article-meta {
+    color: #666;
+    font-size: 0.9em;
+    margin-bottom: 10px;
+}
+.article-description {
+    color: #555;
+    margin: 10px 0;
+}
+.sentiment-badge {
+    display: inline-block;
+    padding: 5px 12px;
+    border-radius: 4px;
+    font-size: 0.9em;
+    font-weight: bold;
+    margin-top: 10px;
+}
+.sentiment-badge.very_positive { background: #28a745; color: white; }
+.sentiment-badge.positive { background: #90ee90; color: black; }
+.sentiment-badge.neutral { background: #ffc107; color: black; }
+.sentiment-badge.negative { background: #ff9999; color: black; }
+.sentiment-badge.very_negative { background: #dc3545; color: white; }
+
+.sentiment-score {
+    display: inline-block;
+    margin-left: 10px;
+    padding: 5px 10px;
+    background: #f8f9fa;
+    border-radius: 4px;
+    font-family: monospace;
+}
+footer {
+    margin-top: 40px;
+    padding-top: 20px;
+    border-top: 1px solid #ddd;
+    text-align: center;
+    color: #666;
+}
+"""
+
+INDEX_TEMPLATE_STR = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -124,105 +194,7 @@ class SiteGenerator:
     'https://www.googletagmanager.com/gtm.js?id='+i+dl;f.parentNode.insertBefore(j,f);
     })(window,document,'script','dataLayer','GTM-MJ7CSN68');</script>
     <!-- End Google Tag Manager -->
-    <style>
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            line-height: 1.6;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }
-        h1 {
-            color: #333;
-            border-bottom: 3px solid #007bff;
-            padding-bottom: 10px;
-        }
-        .summary {
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            margin: 20px 0;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        .source-card {
-            background: white;
-            padding: 20px;
-            margin: 15px 0;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            transition: box-shadow 0.3s;
-        }
-        .source-card:hover {
-            box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-        }
-        .source-card h2 {
-            margin-top: 0;
-            color: #007bff;
-        }
-        .source-card a {
-            text-decoration: none;
-            color: inherit;
-        }
-        .sentiment-bar {
-            height: 30px;
-            background: linear-gradient(to right, #dc3545 0%, #ffc107 50%, #28a745 100%);
-            border-radius: 4px;
-            position: relative;
-            margin: 10px 0;
-        }
-        .sentiment-marker {
-            position: absolute;
-            width: 3px;
-            height: 100%;
-            background: black;
-            top: 0;
-        }
-        .stats {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            gap: 10px;
-            margin: 10px 0;
-        }
-        .stat {
-            padding: 10px;
-            background: #f8f9fa;
-            border-radius: 4px;
-        }
-        .stat-label {
-            font-size: 0.85em;
-            color: #666;
-        }
-        .stat-value {
-            font-size: 1.5em;
-            font-weight: bold;
-            color: #333;
-        }
-        .sentiment-labels {
-            display: flex;
-            gap: 10px;
-            flex-wrap: wrap;
-            margin: 10px 0;
-        }
-        .label-badge {
-            padding: 5px 10px;
-            border-radius: 4px;
-            font-size: 0.85em;
-            background: #e9ecef;
-        }
-        .very_positive { background: #28a745; color: white; }
-        .positive { background: #90ee90; color: black; }
-        .neutral { background: #ffc107; color: black; }
-        .negative { background: #ff9999; color: black; }
-        .very_negative { background: #dc3545; color: white; }
-        footer {
-            margin-top: 40px;
-            padding-top: 20px;
-            border-top: 1px solid #ddd;
-            text-align: center;
-            color: #666;
-        }
-    </style>
+    <link rel="stylesheet" href="style.css">
 </head>
 <!-- Google tag (gtag.js) -->
 <script async src="https://www.googletagmanager.com/gtag/js?id=G-SGCZ0W9FDC"></script>
@@ -243,7 +215,7 @@ class SiteGenerator:
     <div class="summary">
         <p>This site analyzes sentiment about China in articles from major news outlets over the past 12 months.</p>
         <p><strong>Total Articles Analyzed:</strong> {{ total_articles }}</p>
-        <p><strong>News Outlets:</strong> {{ sources|length }}</p>
+        <p><strong>News Outlets:</strong> {{ num_sources }}</p>
     </div>
     
     <h2>News Outlets by Sentiment</h2>
@@ -274,7 +246,7 @@ class SiteGenerator:
         </div>
         
         <div class="sentiment-bar">
-            <div class="sentiment-marker" style="left: {{ ((source.avg_score + 1) / 2 * 100)|round }}%;"></div>
+            <div class="sentiment-marker" style="left: {{ source.marker_pct }}%;"></div>
         </div>
         
         <div class="sentiment-labels">
@@ -289,115 +261,18 @@ class SiteGenerator:
     
     <footer>
         <p>Generated on {{ generation_date }}. Data from RSS feeds of major news outlets.</p>
-        <p>Sentiment analysis performed using spaCy NLP.</p>
+        <p>Sentiment scored from positive/negative word lexicons, using spaCy's English stop-word list.</p>
     </footer>
 </body>
 </html>"""
-        return Template(template_str)
-    
-    def _get_source_template(self) -> Template:
-        """Return the Jinja2 template for source detail pages."""
-        template_str = """<!DOCTYPE html>
+
+SOURCE_TEMPLATE_STR = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{{ source }} - China News Sentiment</title>
-    <style>
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            line-height: 1.6;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }
-        h1 {
-            color: #333;
-            border-bottom: 3px solid #007bff;
-            padding-bottom: 10px;
-        }
-        .back-link {
-            display: inline-block;
-            margin-bottom: 20px;
-            color: #007bff;
-            text-decoration: none;
-        }
-        .back-link:hover {
-            text-decoration: underline;
-        }
-        .summary {
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            margin: 20px 0;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        .article-card {
-            background: white;
-            padding: 20px;
-            margin: 15px 0;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            border-left: 5px solid #ddd;
-        }
-        .article-card.very_positive { border-left-color: #28a745; }
-        .article-card.positive { border-left-color: #90ee90; }
-        .article-card.neutral { border-left-color: #ffc107; }
-        .article-card.negative { border-left-color: #ff9999; }
-        .article-card.very_negative { border-left-color: #dc3545; }
-        
-        .article-title {
-            font-size: 1.3em;
-            font-weight: bold;
-            margin-bottom: 10px;
-        }
-        .article-title a {
-            color: #333;
-            text-decoration: none;
-        }
-        .article-title a:hover {
-            color: #007bff;
-        }
-        .article-meta {
-            color: #666;
-            font-size: 0.9em;
-            margin-bottom: 10px;
-        }
-        .article-description {
-            color: #555;
-            margin: 10px 0;
-        }
-        .sentiment-badge {
-            display: inline-block;
-            padding: 5px 12px;
-            border-radius: 4px;
-            font-size: 0.9em;
-            font-weight: bold;
-            margin-top: 10px;
-        }
-        .sentiment-badge.very_positive { background: #28a745; color: white; }
-        .sentiment-badge.positive { background: #90ee90; color: black; }
-        .sentiment-badge.neutral { background: #ffc107; color: black; }
-        .sentiment-badge.negative { background: #ff9999; color: black; }
-        .sentiment-badge.very_negative { background: #dc3545; color: white; }
-        
-        .sentiment-score {
-            display: inline-block;
-            margin-left: 10px;
-            padding: 5px 10px;
-            background: #f8f9fa;
-            border-radius: 4px;
-            font-family: monospace;
-        }
-        footer {
-            margin-top: 40px;
-            padding-top: 20px;
-            border-top: 1px solid #ddd;
-            text-align: center;
-            color: #666;
-        }
-    </style>
+    <link rel="stylesheet" href="style.css">
 </head>
 <body>
     <a href="index.html" class="back-link">← Back to Overview</a>
@@ -425,7 +300,7 @@ class SiteGenerator:
         </div>
         
         <div class="article-description">
-            {{ article.description[:300] }}{% if article.description|length > 300 %}...{% endif %}
+            {{ article.description_short }}{% if article.description_truncated %}...{% endif %}
         </div>
         
         <div>
@@ -442,4 +317,158 @@ class SiteGenerator:
     </footer>
 </body>
 </html>"""
-        return Template(template_str)
+
+# Number of description characters shown per article on source pages
+DESCRIPTION_PREVIEW_LENGTH = 300
+
+# Large write buffer so streamed pages reach disk in a few writes, not many small ones
+WRITE_BUFFER_SIZE = 256 * 1024
+
+# Compiled template bytecode is cached on disk so later runs skip parsing
+TEMPLATE_CACHE_DIR = os.path.join(CACHE_DIR, "jinja")
+
+# Shared environment: templates compile once per process (and once per source
+# change across runs, via the bytecode cache) and are reused for every render
+_env = Environment(
+    loader=DictLoader({
+        "index.html": INDEX_TEMPLATE_STR,
+        "source.html": SOURCE_TEMPLATE_STR,
+    }),
+    bytecode_cache=FileSystemBytecodeCache(TEMPLATE_CACHE_DIR),
+)
+
+
+class SiteGenerator:
+    """Generates static HTML pages for the analysis results."""
+    
+    def __init__(self, output_dir: str = "site"):
+        self.output_dir = output_dir
+        os.makedirs(output_dir, exist_ok=True)
+        # The bytecode cache lives under CACHE_DIR (relative to the working directory,
+        # independent of output_dir); it is created here rather than at import time
+        os.makedirs(TEMPLATE_CACHE_DIR, exist_ok=True)
+        # Both page templates link to one shared stylesheet, written once per build
+        self._write_stylesheet()
+    
+    def _write_stylesheet(self):
+        """Write the shared stylesheet into the output directory."""
+        output_path = os.path.join(self.output_dir, "style.css")
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(STYLESHEET)
+    
+    def generate_index_page(self, articles_by_source: Dict[str, List[Article]]):
+        """Generate the main index page showing sentiment overview for all outlets."""
+        logger.info("Generating index page...")
+        
+        # Calculate statistics for each source
+        source_stats = []
+        for source, articles in articles_by_source.items():
+            if not articles:
+                continue
+            
+            # Gather score statistics and label counts in a single pass
+            total_score = 0.0
+            scored = 0
+            min_score = math.inf
+            max_score = -math.inf
+            label_counts = {}
+            for article in articles:
+                score = article.sentiment_score
+                if score is not None:
+                    total_score += score
+                    scored += 1
+                    if score < min_score:
+                        min_score = score
+                    if score > max_score:
+                        max_score = score
+                label = article.sentiment_label
+                label_counts[label] = label_counts.get(label, 0) + 1
+            
+            if not scored:
+                continue
+            
+            avg_score = total_score / scored
+            
+            source_stats.append({
+                "name": source,
+                "count": len(articles),
+                "avg_score": round(avg_score, 3),
+                "min_score": round(min_score, 3),
+                "max_score": round(max_score, 3),
+                "label_counts": label_counts,
+                # Position of the average on the -1..1 sentiment bar, as a percentage
+                "marker_pct": round((avg_score + 1) * 50, 1),
+                "filename": self._get_source_filename(source)
+            })
+        
+        # Sort by average score
+        source_stats.sort(key=lambda x: x["avg_score"], reverse=True)
+        
+        # Generate HTML, streaming chunks to disk rather than building the page in memory
+        output_path = os.path.join(self.output_dir, "index.html")
+        with open(output_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            _env.get_template("index.html").stream(
+                sources=source_stats,
+                num_sources=len(source_stats),
+                total_articles=sum(s["count"] for s in source_stats),
+                generation_date=datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+            ).dump(f)
+        
+        logger.info("Index page generated: %s", output_path)
+    
+    def generate_source_pages(self, articles_by_source: Dict[str, List[Article]]):
+        """Generate detail pages for each news outlet concurrently."""
+        logger.info("Generating source detail pages...")
+        
+        sources = [source for source, articles in articles_by_source.items() if articles]
+        if not sources:
+            return
+        
+        # Load the template once up front so worker threads never race to compile it
+        template = _env.get_template("source.html")
+        with ThreadPoolExecutor(max_workers=min(8, len(sources))) as executor:
+            futures = [
+                executor.submit(self._generate_source_page, template, source, articles_by_source[source])
+                for source in sources
+            ]
+            # Surface any rendering or write error to the caller
+            for future in futures:
+                future.result()
+    
+    def _generate_source_page(self, template: Template, source: str, articles: List[Article]):
+        """Render and write the detail page for a single news outlet."""
+        # Sort scored articles by sentiment (C-level attrgetter key), unscored last
+        scored = [a for a in articles if a.sentiment_score is not None]
+        unscored = [a for a in articles if a.sentiment_score is None]
+        scored.sort(key=attrgetter("sentiment_score"), reverse=True)
+        sorted_articles = scored + unscored
+        
+        # Convert to dictionaries, truncating descriptions here rather than in the template
+        articles_data = [a.to_dict() for a in sorted_articles]
+        for article_data in articles_data:
+            description = article_data["description"]
+            article_data["description_short"] = description[:DESCRIPTION_PREVIEW_LENGTH]
+            article_data["description_truncated"] = len(description) > DESCRIPTION_PREVIEW_LENGTH
+        
+        # Calculate statistics
+        # Reuse the scored partition: one attribute load per article, no second filter
+        scores = [a.sentiment_score for a in scored]
+        avg_score = sum(scores) / len(scores) if scores else 0
+        
+        filename = self._get_source_filename(source)
+        output_path = os.path.join(self.output_dir, filename)
+        with open(output_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            template.stream(
+                source=source,
+                articles=articles_data,
+                avg_score=round(avg_score, 3),
+                count=len(articles)
+            ).dump(f)
+        
+        logger.info("Generated page for %s: %s", source, output_path)
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_source_filename(source: str) -> str:
+        """Convert source name to a filename (memoized per source name)."""
+        return source.lower().replace(" ", "_") + ".html"
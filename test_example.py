@@ -1,11 +1,17 @@
 #!/usr/bin/env python3
 """Test script to demonstrate functionality with sample data."""
 
+import os
+import spacy
+import tempfile
 from datetime import datetime, timedelta, timezone
 from rss_fetcher import Article, RSSFetcher
-from sentiment_analyzer import SentimentAnalyzer
+from sentiment_analyzer import SentimentAnalyzer, POSITIVE_WORDS, NEGATIVE_WORDS
 from site_generator import SiteGenerator
-from config import CHINA_KEYWORDS
+from config import CHINA_KEYWORDS, SENTIMENT_NORMALIZATION_FACTOR
+
+# Single clock read shared by all sample data, so dates are consistent across tests
+NOW = datetime.now(timezone.utc)
 
 def create_sample_articles():
     """Create sample articles for testing."""
@@ -14,21 +20,21 @@ def create_sample_articles():
             Article(
                 title="China announces major economic reforms",
                 link="https://example.com/article1",
-                published=datetime.now() - timedelta(days=30),
+                published=NOW - timedelta(days=30),
                 description="China has unveiled a comprehensive package of economic reforms aimed at boosting growth and innovation in key sectors.",
                 source="BBC News"
             ),
             Article(
                 title="Tensions rise over Taiwan strait incident",
                 link="https://example.com/article2",
-                published=datetime.now() - timedelta(days=15),
+                published=NOW - timedelta(days=15),
                 description="Military tensions escalated today following reports of increased activity near Taiwan, raising concerns among international observers.",
                 source="BBC News"
             ),
             Article(
                 title="Beijing hosts successful international summit",
                 link="https://example.com/article3",
-                published=datetime.now() - timedelta(days=5),
+                published=NOW - timedelta(days=5),
                 description="Leaders from around the world gathered in Beijing for a landmark summit on climate cooperation, marking a significant diplomatic achievement.",
                 source="BBC News"
             ),
@@ -37,14 +43,14 @@ def create_sample_articles():
             Article(
                 title="US-China trade relations show signs of improvement",
                 link="https://example.com/article4",
-                published=datetime.now() - timedelta(days=20),
+                published=NOW - timedelta(days=20),
                 description="Recent diplomatic efforts have led to positive developments in trade negotiations between Washington and Beijing.",
                 source="CNN"
             ),
             Article(
                 title="Hong Kong protests continue amid political uncertainty",
                 link="https://example.com/article5",
-                published=datetime.now() - timedelta(days=60),
+                published=NOW - timedelta(days=60),
                 description="Demonstrators in Hong Kong continued their protests today, calling for greater democratic freedoms and expressing concerns over recent policy changes.",
                 source="CNN"
             ),
@@ -53,14 +59,14 @@ def create_sample_articles():
             Article(
                 title="China's tech sector faces new regulatory challenges",
                 link="https://example.com/article6",
-                published=datetime.now() - timedelta(days=10),
+                published=NOW - timedelta(days=10),
                 description="Technology companies in China are grappling with stricter government regulations as authorities seek to address concerns over data security and market dominance.",
                 source="The Guardian"
             ),
             Article(
                 title="Shanghai emerges as global innovation hub",
                 link="https://example.com/article7",
-                published=datetime.now() - timedelta(days=45),
+                published=NOW - timedelta(days=45),
                 description="Shanghai continues to attract international businesses and startups, solidifying its position as a leading center for technology and innovation in Asia.",
                 source="The Guardian"
             ),
@@ -107,6 +113,103 @@ def test_keyword_word_boundary_matching():
     print()
 
 
+def test_sentiment_scoring():
+    """Test the word polarity scorer on short texts."""
+    print("=" * 60)
+    print("Testing Sentiment Scoring")
+    print("=" * 60)
+
+    analyzer = SentimentAnalyzer(CHINA_KEYWORDS)
+
+    # Test 1: polarity words drive the sign of the score
+    assert analyzer.analyze_sentiment("Strong growth and innovation") > 0, \
+        "Positive words should give a positive score"
+    assert analyzer.analyze_sentiment("Crisis deepens as tension and conflict grow") < 0, \
+        "Negative words should give a negative score"
+    print("✓ Test 1 passed: polarity words set the score sign")
+
+    # Test 2: matching is case-insensitive and ignores punctuation
+    assert analyzer.analyze_sentiment("SUCCESS!") == analyzer.analyze_sentiment("success"), \
+        "Scoring should ignore case and punctuation"
+    print("✓ Test 2 passed: case and punctuation are ignored")
+
+    # Test 3: text without content words scores neutral
+    assert analyzer.analyze_sentiment("") == 0, "Empty text should score 0"
+    assert analyzer.analyze_sentiment("it is what it is...") == 0, "Stop words alone should score 0"
+    print("✓ Test 3 passed: text without content words is neutral")
+
+    # Test 4: scores match the original spaCy Doc-based scorer on feed-style text,
+    # including typographic apostrophes, contractions, non-ASCII words, numbers
+    # and abbreviations
+    nlp = spacy.blank("en")
+    def doc_score(text):
+        tokens = [t.text.lower() for t in nlp(text) if not t.is_stop and not t.is_punct]
+        polarity = sum((w in POSITIVE_WORDS) - (w in NEGATIVE_WORDS) for w in tokens)
+        if not tokens:
+            return 0
+        return max(-1, min(1, polarity / max(len(tokens) * SENTIMENT_NORMALIZATION_FACTOR, 1)))
+
+    feed_texts = [
+        "China’s leader won’t attend the summit, citing growing tension over Taiwan.",
+        "Don't expect a breakthrough in US-China talks in 2024, analysts warn amid the crisis.",
+        "Café owners in Zürich fear über-strict rules could threaten Beijing’s growth plans.",
+        "O'Brien says they'd welcome progress, but we've seen the risk; I'm not sure it's strong.",
+        "Officials in Beijing said output rose 4.6% to 1,250,000 units, a strong gain "
+        "for the U.K.-based firm despite the crisis.",
+        "At 10:30 a.m. the U.S. said COVID-19 curbs cut 5-year growth by 0.8 points.",
+    ]
+    for text in feed_texts:
+        assert abs(analyzer.analyze_sentiment(text) - doc_score(text)) < 1e-9, \
+            f"Score should match the spaCy tokenizer for: {text}"
+    print("✓ Test 4 passed: scores match spaCy tokenization on feed-style text")
+
+    print("=" * 60)
+    print("✅ All sentiment scoring tests passed!")
+    print("=" * 60)
+    print()
+
+
+def test_process_matches_filter_then_analyze():
+    """Test that the fused process() pass matches filtering then analyzing."""
+    print("=" * 60)
+    print("Testing Fused Filter and Analysis")
+    print("=" * 60)
+
+    analyzer = SentimentAnalyzer(CHINA_KEYWORDS)
+    articles = create_sample_articles()["BBC News"] + [
+        Article(
+            title="Pope Leo XIV visits new machinery plant",
+            link="https://example.com/unrelated",
+            published=NOW,
+            description="A strong start for the factory's growth.",
+            source="BBC News"
+        ),
+    ]
+
+    expected = analyzer.analyze_articles(analyzer.filter_china_articles(articles))
+    expected_results = [(a.link, a.sentiment_score, a.sentiment_label) for a in expected]
+    for article in articles:
+        article.sentiment_score = None
+        article.sentiment_label = None
+
+    processed = analyzer.process(articles)
+
+    # Test 1: the same articles are kept, in the same order
+    assert [a.link for a in processed] == [link for link, _, _ in expected_results], \
+        "process() should keep the same articles as filter_china_articles()"
+    print("✓ Test 1 passed: process() keeps the same China-related articles")
+
+    # Test 2: scores and labels match analyze_articles()
+    assert [(a.link, a.sentiment_score, a.sentiment_label) for a in processed] == expected_results, \
+        "process() should produce the same sentiment as analyze_articles()"
+    print("✓ Test 2 passed: process() produces the same sentiment scores and labels")
+
+    print("=" * 60)
+    print("✅ All fused filter and analysis tests passed!")
+    print("=" * 60)
+    print()
+
+
 def test_timezone_normalization():
     """Test timezone-aware datetime normalization."""
     print("=" * 60)
@@ -148,14 +251,14 @@ def test_timezone_normalization():
     recent_article = Article(
         title="Recent Article",
         link="https://example.com/recent",
-        published=datetime.now(timezone.utc) - timedelta(days=30),
+        published=NOW - timedelta(days=30),
         description="Recent test",
         source="Test"
     )
     old_article = Article(
         title="Old Article",
         link="https://example.com/old",
-        published=datetime.now(timezone.utc) - timedelta(days=400),
+        published=NOW - timedelta(days=400),
         description="Old test",
         source="Test"
     )
@@ -168,6 +271,153 @@ def test_timezone_normalization():
     print("=" * 60)
     print()
 
+def test_fetch_all_feeds_isolates_failures():
+    """Test that one failing feed does not abort the concurrent batch."""
+    print("=" * 60)
+    print("Testing Concurrent Feed Fetching")
+    print("=" * 60)
+
+    class StubFetcher(RSSFetcher):
+        def fetch_feed(self, feed_url, source_name):
+            if source_name == "Broken":
+                raise RuntimeError("simulated failure")
+            return [Article(
+                title=f"{source_name} headline",
+                link=feed_url,
+                published=NOW,
+                description="Stub description",
+                source=source_name
+            )]
+
+    feeds = {
+        "First": "https://example.com/first.xml",
+        "Broken": "https://example.com/broken.xml",
+        "Last": "https://example.com/last.xml",
+    }
+    results = StubFetcher(months_back=12).fetch_all_feeds(feeds)
+
+    # Test 1: every configured source is present, in configured order
+    assert list(results) == list(feeds), "Results should keep the configured source order"
+    print("✓ Test 1 passed: all sources present in configured order")
+
+    # Test 2: the failing feed yields an empty list while the others succeed
+    assert results["Broken"] == [], "Failing feed should yield no articles"
+    assert len(results["First"]) == 1 and len(results["Last"]) == 1, \
+        "Healthy feeds should still return their articles"
+    print("✓ Test 2 passed: failing feed is isolated from the rest of the batch")
+
+    print("=" * 60)
+    print("✅ All concurrent feed fetching tests passed!")
+    print("=" * 60)
+    print()
+
+def test_feed_cache_conditional_get():
+    """Test that cached feeds are revalidated with a conditional GET."""
+    print("=" * 60)
+    print("Testing Feed Cache Conditional Requests")
+    print("=" * 60)
+
+    published = NOW.strftime("%a, %d %b %Y %H:%M:%S +0000")
+    feed_body = (
+        '<?xml version="1.0"?><rss version="2.0"><channel><title>Stub</title>'
+        '<item><title>China unveils growth plan</title><link>/news/a</link>'
+        f'<description>Stub description</description><pubDate>{published}</pubDate></item>'
+        '</channel></rss>'
+    ).encode("utf-8")
+
+    class StubResponse:
+        def __init__(self, url, status_code, content=b"", headers=None):
+            self.url = url
+            self.status_code = status_code
+            self.content = content
+            self.headers = headers or {}
+
+        def raise_for_status(self):
+            pass
+
+    class StubSession:
+        def __init__(self):
+            self.sent_headers = []
+
+        def get(self, url, headers=None, timeout=None):
+            self.sent_headers.append(headers or {})
+            if (headers or {}).get("If-None-Match") == '"v1"':
+                return StubResponse(url, 304)
+            return StubResponse(url, 200, feed_body, {"ETag": '"v1"'})
+
+    url = "https://example.com/feed.xml"
+    with tempfile.TemporaryDirectory() as cache_dir:
+        first = RSSFetcher(months_back=12, cache_dir=cache_dir)
+        first._session = StubSession()
+        first_results = first.fetch_all_feeds({"Stub": url})
+
+        second = RSSFetcher(months_back=12, cache_dir=cache_dir)
+        second._session = StubSession()
+        second_results = second.fetch_all_feeds({"Stub": url})
+
+        # Truncate the cached articles, as a run killed mid-write would have
+        cache_path = second._cache_path(url)
+        with open(cache_path, "r+b") as f:
+            f.truncate(10)
+
+        third = RSSFetcher(months_back=12, cache_dir=cache_dir)
+        third._session = StubSession()
+        third_results = third.fetch_all_feeds({"Stub": url})
+
+        fourth = RSSFetcher(months_back=12, cache_dir=cache_dir)
+        fourth._session = StubSession()
+        fourth_results = fourth.fetch_all_feeds({"Stub": url})
+
+    # Test 1: the first run sends no validators, the second sends the stored ETag
+    assert "If-None-Match" not in first._session.sent_headers[0], \
+        "First request should be unconditional"
+    assert second._session.sent_headers[0].get("If-None-Match") == '"v1"', \
+        "Second request should send the cached ETag"
+    print("✓ Test 1 passed: stored ETag is sent on the next run")
+
+    # Test 2: relative item links are resolved against the feed URL
+    assert [a.link for a in first_results["Stub"]] == ["https://example.com/news/a"], \
+        "Relative item links should be made absolute"
+    print("✓ Test 2 passed: relative links are resolved against the feed URL")
+
+    # Test 3: a 304 response is served from the cached parsed articles
+    assert [a.title for a in second_results["Stub"]] == [a.title for a in first_results["Stub"]], \
+        "Not-modified feed should yield the cached articles"
+    print("✓ Test 3 passed: 304 responses reuse the cached articles")
+
+    # Test 4: an unreadable cache entry falls back to a full, unconditional fetch
+    assert [a.title for a in third_results["Stub"]] == [a.title for a in first_results["Stub"]], \
+        "A corrupt cache entry should not leave the feed empty"
+    assert "If-None-Match" not in third._session.sent_headers[-1], \
+        "The fallback request should be unconditional"
+    assert [a.title for a in fourth_results["Stub"]] == [a.title for a in first_results["Stub"]], \
+        "The cache entry should be rewritten by the fallback fetch"
+    assert fourth._session.sent_headers[0].get("If-None-Match") == '"v1"', \
+        "Validators should be stored again after the fallback fetch"
+    print("✓ Test 4 passed: corrupt cache entries are refetched and replaced")
+
+    # Test 5: a malformed validators file or an unwritable cache is not fatal
+    with tempfile.TemporaryDirectory() as cache_dir:
+        with open(os.path.join(cache_dir, "feeds.json"), "w", encoding="utf-8") as f:
+            f.write('["not", "a", "mapping"]')
+        malformed = RSSFetcher(months_back=12, cache_dir=cache_dir)
+        malformed._session = StubSession()
+        malformed_results = malformed.fetch_all_feeds({"Stub": url})
+
+        blocked_path = os.path.join(cache_dir, "blocked")
+        open(blocked_path, "w").close()
+        blocked = RSSFetcher(months_back=12, cache_dir=blocked_path)
+        blocked._session = StubSession()
+        blocked_results = blocked.fetch_all_feeds({"Stub": url})
+    assert len(malformed_results["Stub"]) == 1, "A malformed feeds.json should be ignored"
+    assert len(blocked_results["Stub"]) == 1, "An unwritable cache should not lose articles"
+    print("✓ Test 5 passed: malformed or unwritable caches are ignored")
+
+    print("=" * 60)
+    print("✅ All feed cache tests passed!")
+    print("=" * 60)
+    print()
+
 def main():
     """Test the sentiment analysis pipeline with sample data."""
     # Run timezone normalization tests first
@@ -175,6 +425,18 @@ def main():
 
     # Run keyword word boundary matching tests
     test_keyword_word_boundary_matching()
+
+    # Run sentiment scoring tests
+    test_sentiment_scoring()
+
+    # Run fused filter and analysis tests
+    test_process_matches_filter_then_analyze()
+
+    # Run concurrent feed fetching tests
+    test_fetch_all_feeds_isolates_failures()
+
+    # Run feed cache tests
+    test_feed_cache_conditional_get()
     
     print("=" * 60)
     print("Testing China News Sentiment Analysis")